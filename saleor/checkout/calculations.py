@@ -1,5 +1,6 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, NamedTuple, Optional, Tuple
+from uuid import UUID
 
 from django.conf import settings
 from django.utils import timezone
@@ -193,6 +194,43 @@ def checkout_line_unit_price(
     return quantize_price(unit_price, currency)
 
 
+class CheckoutLinePrices(NamedTuple):
+    unit_price: TaxedMoney
+    total_price: TaxedMoney
+
+
+def checkout_lines_prices(
+    *,
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+) -> Dict[UUID, CheckoutLinePrices]:
+    """Return the unit and total prices of all checkout lines, taxes included.
+
+    It takes in account all plugins. Prices are fetched once for the whole checkout,
+    which is cheaper than calling `checkout_line_unit_price` and
+    `checkout_line_total` for each line separately.
+    """
+    currency = checkout_info.checkout.currency
+    address = checkout_info.shipping_address or checkout_info.billing_address
+    _, lines = fetch_checkout_data(
+        checkout_info,
+        manager=manager,
+        lines=lines,
+        address=address,
+    )
+    prices = {}
+    for line_info in lines:
+        checkout_line = line_info.line
+        prices[checkout_line.pk] = CheckoutLinePrices(
+            unit_price=quantize_price(
+                checkout_line.total_price / checkout_line.quantity, currency
+            ),
+            total_price=quantize_price(checkout_line.total_price, currency),
+        )
+    return prices
+
+
 def checkout_line_tax_rate(
     *,
     manager: "PluginsManager",
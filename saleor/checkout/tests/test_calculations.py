@@ -20,6 +20,9 @@ from ..base_calculations import (
 from ..calculations import (
     _apply_tax_data,
     _get_checkout_base_prices,
+    checkout_line_total,
+    checkout_line_unit_price,
+    checkout_lines_prices,
     fetch_checkout_data,
 )
 from ..fetch import CheckoutLineInfo, fetch_checkout_info, fetch_checkout_lines
@@ -186,6 +189,28 @@ def test_fetch_checkout_data_plugins(
     assert checkout_with_items.total == subtotal + shipping_price
 
 
+@patch("saleor.checkout.calculations.fetch_checkout_data", wraps=fetch_checkout_data)
+def test_checkout_lines_prices(mocked_fetch_checkout_data, fetch_kwargs):
+    # given
+    del fetch_kwargs["address"]
+    lines = fetch_kwargs["lines"]
+
+    # when
+    prices = checkout_lines_prices(**fetch_kwargs)
+
+    # then
+    mocked_fetch_checkout_data.assert_called_once()
+    assert prices.keys() == {line_info.line.pk for line_info in lines}
+    for line_info in lines:
+        line_prices = prices[line_info.line.pk]
+        assert line_prices.unit_price == checkout_line_unit_price(
+            checkout_line_info=line_info, **fetch_kwargs
+        )
+        assert line_prices.total_price == checkout_line_total(
+            checkout_line_info=line_info, **fetch_kwargs
+        )
+
+
 @patch(
     "saleor.checkout.calculations.update_checkout_prices_with_flat_rates",
     wraps=update_checkout_prices_with_flat_rates,
@@ -1,8 +1,13 @@
 from datetime import timedelta
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import pytest
+from graphql.language.parser import parse
+
+from ......account.models import User
 from ......core.jwt import create_token
-from .....tests.utils import get_graphql_content
+from .....tests.utils import execute_graphql
 
 EMAIL_UPDATE_QUERY = """
 mutation emailUpdate($token: String!, $channel: String) {
@@ -18,59 +23,86 @@ mutation emailUpdate($token: String!, $channel: String) {
   }
 }
 """
+EMAIL_UPDATE_QUERY_AST = parse(EMAIL_UPDATE_QUERY)
+TOKEN_TTL = timedelta(hours=1)
 
 
-@patch(
-    "saleor.graphql.account.mutations.account.confirm_email_change.match_orders_with_new_user"
-)
-@patch(
-    "saleor.graphql.account.mutations.account.confirm_email_change.assign_user_gift_cards"
-)
-def test_email_update(
-    assign_gift_cards_mock,
-    assign_orders_mock,
-    user_api_client,
-    customer_user,
-    channel_PLN,
-):
-    new_email = "new_email@example.com"
+def create_email_change_token(user, new_email):
     payload = {
-        "old_email": customer_user.email,
+        "old_email": user.email,
         "new_email": new_email,
-        "user_pk": customer_user.pk,
+        "user_pk": user.pk,
     }
-    user = user_api_client.user
+    return create_token(payload, TOKEN_TTL)
 
-    token = create_token(payload, timedelta(hours=1))
-    variables = {"token": token, "channel": channel_PLN.slug}
 
-    response = user_api_client.post_graphql(EMAIL_UPDATE_QUERY, variables)
-    content = get_graphql_content(response)
-    data = content["data"]["confirmEmailChange"]
-    assert data["user"]["email"] == new_email
-    user.refresh_from_db()
-    assert new_email in user.search_document
-    assign_gift_cards_mock.assert_called_once_with(customer_user)
-    assign_orders_mock.assert_called_once_with(customer_user)
+@pytest.fixture
+def confirm_email_change_side_effects(monkeypatch):
+    module = "saleor.graphql.account.mutations.account.confirm_email_change"
+    match_orders_mock = MagicMock()
+    assign_gift_cards_mock = MagicMock()
+    monkeypatch.setattr(f"{module}.match_orders_with_new_user", match_orders_mock)
+    monkeypatch.setattr(f"{module}.assign_user_gift_cards", assign_gift_cards_mock)
+    return SimpleNamespace(
+        match_orders=match_orders_mock, assign_gift_cards=assign_gift_cards_mock
+    )
 
 
-def test_email_update_to_existing_email(user_api_client, customer_user, staff_user):
-    payload = {
-        "old_email": customer_user.email,
-        "new_email": staff_user.email,
-        "user_pk": customer_user.pk,
-    }
-    token = create_token(payload, timedelta(hours=1))
+@pytest.fixture
+def existing_user_email():
+    email = "existing_user@example.com"
+    User.objects.create(email=email)
+    return email
+
+
+@pytest.mark.parametrize(
+    (
+        "new_email_fixture_name",
+        "channel_fixture_name",
+        "expect_success",
+        "expected_query_count",
+    ),
+    [(None, "channel_PLN", True, 6), ("existing_user_email", None, False, 3)],
+)
+def test_email_update(
+    confirm_email_change_side_effects,
+    new_email_fixture_name,
+    channel_fixture_name,
+    expect_success,
+    expected_query_count,
+    request,
+    customer_user,
+    django_assert_num_queries,
+):
+    new_email = "new_email@example.com"
+    if new_email_fixture_name:
+        new_email = request.getfixturevalue(new_email_fixture_name)
+
+    token = create_email_change_token(customer_user, new_email)
     variables = {"token": token}
+    if channel_fixture_name:
+        variables["channel"] = request.getfixturevalue(channel_fixture_name).slug
 
-    response = user_api_client.post_graphql(EMAIL_UPDATE_QUERY, variables)
-    content = get_graphql_content(response)
-    data = content["data"]["confirmEmailChange"]
-    assert not data["user"]
-    assert data["errors"] == [
-        {
-            "code": "UNIQUE",
-            "message": "Email is used by other user.",
-            "field": "newEmail",
-        }
-    ]
+    with django_assert_num_queries(expected_query_count):
+        result = execute_graphql(EMAIL_UPDATE_QUERY_AST, variables, user=customer_user)
+    assert not result.errors
+    data = result.data["confirmEmailChange"]
+    side_effects = confirm_email_change_side_effects
+    if expect_success:
+        assert not data["errors"]
+        assert data["user"]["email"] == new_email
+        customer_user.refresh_from_db()
+        assert new_email in customer_user.search_document
+        side_effects.assign_gift_cards.assert_called_once_with(customer_user)
+        side_effects.match_orders.assert_called_once_with(customer_user)
+    else:
+        assert not data["user"]
+        assert data["errors"] == [
+            {
+                "code": "UNIQUE",
+                "message": "Email is used by other user.",
+                "field": "newEmail",
+            }
+        ]
+        side_effects.assign_gift_cards.assert_not_called()
+        side_effects.match_orders.assert_not_called()
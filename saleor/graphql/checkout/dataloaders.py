@@ -1,9 +1,11 @@
 from collections import defaultdict
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
 
 from django.db.models import F
 from promise import Promise
 
+from ...checkout.calculations import CheckoutLinePrices, checkout_lines_prices
 from ...checkout.fetch import (
     CheckoutInfo,
     CheckoutLineInfo,
@@ -189,6 +191,52 @@ class CheckoutLinesInfoByCheckoutTokenLoader(DataLoader[str, List[CheckoutLineIn
         return Promise.all([checkouts, checkout_lines]).then(with_checkout_lines)
 
 
+class CheckoutLinesInfoMapByCheckoutTokenLoader(
+    DataLoader[str, Dict[UUID, CheckoutLineInfo]]
+):
+    context_key = "checkoutlinesinfo_map_by_checkout"
+
+    def batch_load(self, keys):
+        def with_lines_info(checkouts_lines_info):
+            return [
+                {line_info.line.pk: line_info for line_info in lines_info}
+                for lines_info in checkouts_lines_info
+            ]
+
+        return (
+            CheckoutLinesInfoByCheckoutTokenLoader(self.context)
+            .load_many(keys)
+            .then(with_lines_info)
+        )
+
+
+class CheckoutLinesPricesByCheckoutTokenLoader(
+    DataLoader[str, Dict[UUID, CheckoutLinePrices]]
+):
+    context_key = "checkoutlinesprices_by_checkout"
+
+    def batch_load(self, keys):
+        def with_checkout_data(data):
+            checkout_infos, checkouts_lines_info, manager = data
+            return [
+                checkout_lines_prices(
+                    manager=manager, checkout_info=checkout_info, lines=lines_info
+                )
+                for checkout_info, lines_info in zip(
+                    checkout_infos, checkouts_lines_info
+                )
+            ]
+
+        checkout_infos = CheckoutInfoByCheckoutTokenLoader(self.context).load_many(keys)
+        checkouts_lines_info = CheckoutLinesInfoByCheckoutTokenLoader(
+            self.context
+        ).load_many(keys)
+        manager = get_plugin_manager_promise(self.context)
+        return Promise.all([checkout_infos, checkouts_lines_info, manager]).then(
+            with_checkout_data
+        )
+
+
 class CheckoutByUserLoader(DataLoader[int, List[Checkout]]):
     context_key = "checkout_by_user"
 
@@ -436,26 +484,3 @@ class CheckoutMetadataByCheckoutIdLoader(DataLoader[str, CheckoutMetadata]):
             self.database_connection_name
         ).in_bulk(keys, field_name="checkout_id")
         return [checkout_metadata.get(checkout_id) for checkout_id in keys]
-
-
-class ChannelByCheckoutLineIDLoader(DataLoader):
-    context_key = "channel_by_checkout_line"
-
-    def batch_load(self, keys):
-        def channel_by_lines(checkout_lines):
-            checkout_ids = [line.checkout_id for line in checkout_lines]
-
-            def channels_by_checkout(checkouts):
-                channel_ids = [checkout.channel_id for checkout in checkouts]
-
-                return ChannelByIdLoader(self.context).load_many(channel_ids)
-
-            return (
-                CheckoutByTokenLoader(self.context)
-                .load_many(checkout_ids)
-                .then(channels_by_checkout)
-            )
-
-        return (
-            CheckoutLineByIdLoader(self.context).load_many(keys).then(channel_by_lines)
-        )
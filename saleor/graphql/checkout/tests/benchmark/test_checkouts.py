@@ -40,3 +40,54 @@ def test_staff_multiple_checkouts(
 
     # then
     assert len(content["data"]["checkouts"]["edges"]) == 10
+
+
+MULTIPLE_CHECKOUT_GIFT_CARDS_QUERY = """
+query multipleCheckouts {
+  checkouts(first: 100){
+    edges {
+      node {
+        id
+        giftCards {
+          id
+          last4CodeChars
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_staff_multiple_checkouts_gift_cards(
+    staff_api_client,
+    permission_manage_checkouts,
+    permission_manage_users,
+    permission_manage_gift_card,
+    checkouts_for_benchmarks,
+    gift_card,
+    gift_card_created_by_staff,
+    count_queries,
+):
+    # given
+    staff_api_client.user.user_permissions.set(
+        [
+            permission_manage_checkouts,
+            permission_manage_users,
+            permission_manage_gift_card,
+        ]
+    )
+    for checkout in checkouts_for_benchmarks:
+        checkout.gift_cards.add(gift_card, gift_card_created_by_staff)
+
+    # when
+    content = get_graphql_content(
+        staff_api_client.post_graphql(MULTIPLE_CHECKOUT_GIFT_CARDS_QUERY)
+    )
+
+    # then
+    edges = content["data"]["checkouts"]["edges"]
+    assert len(edges) == 10
+    assert all(len(edge["node"]["giftCards"]) == 2 for edge in edges)
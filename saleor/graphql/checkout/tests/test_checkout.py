@@ -1972,6 +1972,56 @@ def test_query_without_channel(
     assert len(content["data"]["checkouts"]["edges"]) == 5
 
 
+def test_query_checkouts_gift_cards(
+    checkouts_list,
+    staff_api_client,
+    permission_manage_checkouts,
+    gift_card,
+    gift_card_used,
+    gift_card_created_by_staff,
+):
+    # given
+    query = """
+    {
+        checkouts(first: 20) {
+            edges {
+                node {
+                    token
+                    giftCards {
+                        id
+                    }
+                }
+            }
+        }
+    }
+    """
+    checkout_with_cards, checkout_with_card, checkout_without_cards = checkouts_list[:3]
+    checkout_with_cards.gift_cards.add(gift_card)
+    checkout_with_cards.gift_cards.add(gift_card_used)
+    checkout_with_cards.gift_cards.add(gift_card_created_by_staff)
+    checkout_with_card.gift_cards.add(gift_card_used)
+
+    # when
+    response = staff_api_client.post_graphql(
+        query, {}, permissions=[permission_manage_checkouts]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    gift_cards_by_token = {
+        edge["node"]["token"]: [card["id"] for card in edge["node"]["giftCards"]]
+        for edge in content["data"]["checkouts"]["edges"]
+    }
+    assert gift_cards_by_token[str(checkout_with_cards.token)] == [
+        graphene.Node.to_global_id("GiftCard", card.pk)
+        for card in [gift_card_created_by_staff, gift_card_used, gift_card]
+    ]
+    assert gift_cards_by_token[str(checkout_with_card.token)] == [
+        graphene.Node.to_global_id("GiftCard", gift_card_used.pk)
+    ]
+    assert gift_cards_by_token[str(checkout_without_cards.token)] == []
+
+
 def test_query_checkout_lines(
     checkout_with_item, staff_api_client, permission_manage_checkouts
 ):
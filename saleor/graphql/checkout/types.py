@@ -25,7 +25,7 @@ from ..account.dataloaders import AddressByIdLoader
 from ..account.utils import check_is_owner_or_has_one_of_perms
 from ..channel import ChannelContext
 from ..channel.types import Channel
-from ..checkout.dataloaders import ChannelByCheckoutLineIDLoader, ChannelByIdLoader
+from ..checkout.dataloaders import ChannelByIdLoader
 from ..core import ResolveInfo
 from ..core.connection import CountableConnection
 from ..core.descriptions import (
@@ -45,6 +45,7 @@ from ..core.tracing import traced_resolver
 from ..core.types import BaseObjectType, ModelObjectType, Money, NonNullList, TaxedMoney
 from ..core.utils import str_to_enum
 from ..decorators import one_of_permissions_required
+from ..giftcard.dataloaders import GiftCardsByCheckoutIdLoader
 from ..giftcard.types import GiftCard
 from ..meta import resolvers as MetaResolvers
 from ..meta.types import ObjectWithMetadata, _filter_metadata
@@ -72,6 +73,8 @@ from .dataloaders import (
     CheckoutInfoByCheckoutTokenLoader,
     CheckoutLinesByCheckoutTokenLoader,
     CheckoutLinesInfoByCheckoutTokenLoader,
+    CheckoutLinesInfoMapByCheckoutTokenLoader,
+    CheckoutLinesPricesByCheckoutTokenLoader,
     CheckoutMetadataByCheckoutIdLoader,
     TransactionItemsByCheckoutIDLoader,
 )
@@ -100,6 +103,27 @@ def get_dataloaders_for_fetching_checkout_data(
     return address, lines, checkout_info, manager
 
 
+def get_checkout_info_with_fetched_data(
+    root: models.Checkout, info: ResolveInfo
+) -> Promise["CheckoutInfo"]:
+    """Return checkout info with prices and payment statuses refreshed if expired."""
+
+    def with_checkout_data(data):
+        address, lines, checkout_info, manager, transactions = data
+        fetch_checkout_data(
+            checkout_info=checkout_info,
+            manager=manager,
+            lines=lines,
+            address=address,
+            checkout_transactions=transactions,
+        )
+        return checkout_info
+
+    dataloaders = list(get_dataloaders_for_fetching_checkout_data(root, info))
+    dataloaders.append(TransactionItemsByCheckoutIDLoader(info.context).load(root.pk))
+    return Promise.all(dataloaders).then(with_checkout_data)
+
+
 class GatewayConfigLine(BaseObjectType):
     field = graphene.String(required=True, description="Gateway config key.")
     value = graphene.String(description="Gateway config value for key.")
@@ -175,8 +199,15 @@ class CheckoutLine(ModelObjectType[models.CheckoutLine]):
 
     @staticmethod
     def resolve_variant(root: models.CheckoutLine, info: ResolveInfo):
+        def channel_by_checkout(checkout):
+            return ChannelByIdLoader(info.context).load(checkout.channel_id)
+
         variant = ProductVariantByIdLoader(info.context).load(root.variant_id)
-        channel = ChannelByCheckoutLineIDLoader(info.context).load(root.id)
+        channel = (
+            CheckoutByTokenLoader(info.context)
+            .load(root.checkout_id)
+            .then(channel_by_checkout)
+        )
 
         return Promise.all([variant, channel]).then(
             lambda data: ChannelContext(node=data[0], channel_slug=data[1].slug)
@@ -185,147 +216,64 @@ class CheckoutLine(ModelObjectType[models.CheckoutLine]):
     @staticmethod
     @prevent_sync_event_circular_query
     def resolve_unit_price(root, info: ResolveInfo):
-        def with_checkout(data):
-            checkout, manager = data
-            checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-            lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-
-            def calculate_line_unit_price(data):
-                (
-                    checkout_info,
-                    lines,
-                ) = data
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculations.checkout_line_unit_price(
-                            manager=manager,
-                            checkout_info=checkout_info,
-                            lines=lines,
-                            checkout_line_info=line_info,
-                        )
+        def get_line_unit_price(lines_prices):
+            line_prices = lines_prices.get(root.pk)
+            if line_prices is None:
                 return None
+            return line_prices.unit_price
 
-            return Promise.all(
-                [
-                    checkout_info,
-                    lines,
-                ]
-            ).then(calculate_line_unit_price)
-
-        return Promise.all(
-            [
-                CheckoutByTokenLoader(info.context).load(root.checkout_id),
-                get_plugin_manager_promise(info.context),
-            ]
-        ).then(with_checkout)
+        return (
+            CheckoutLinesPricesByCheckoutTokenLoader(info.context)
+            .load(root.checkout_id)
+            .then(get_line_unit_price)
+        )
 
     @staticmethod
     def resolve_undiscounted_unit_price(root, info: ResolveInfo):
-        def with_checkout(checkout):
-            checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-            lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-
-            def calculate_undiscounted_unit_price(data):
-                (
-                    checkout_info,
-                    lines,
-                ) = data
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculate_undiscounted_base_line_unit_price(
-                            line_info, checkout_info.channel
-                        )
-
+        def calculate_undiscounted_unit_price(lines_info_map):
+            line_info = lines_info_map.get(root.pk)
+            if line_info is None:
                 return None
-
-            return Promise.all(
-                [
-                    checkout_info,
-                    lines,
-                ]
-            ).then(calculate_undiscounted_unit_price)
+            return calculate_undiscounted_base_line_unit_price(
+                line_info, line_info.channel
+            )
 
         return (
-            CheckoutByTokenLoader(info.context)
+            CheckoutLinesInfoMapByCheckoutTokenLoader(info.context)
             .load(root.checkout_id)
-            .then(with_checkout)
+            .then(calculate_undiscounted_unit_price)
         )
 
     @staticmethod
     @traced_resolver
     @prevent_sync_event_circular_query
     def resolve_total_price(root, info: ResolveInfo):
-        def with_checkout(data):
-            checkout, manager = data
-            checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-            lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-
-            def calculate_line_total_price(data):
-                (checkout_info, lines) = data
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculations.checkout_line_total(
-                            manager=manager,
-                            checkout_info=checkout_info,
-                            lines=lines,
-                            checkout_line_info=line_info,
-                        )
+        def get_line_total_price(lines_prices):
+            line_prices = lines_prices.get(root.pk)
+            if line_prices is None:
                 return None
+            return line_prices.total_price
 
-            return Promise.all([checkout_info, lines]).then(calculate_line_total_price)
-
-        return Promise.all(
-            [
-                CheckoutByTokenLoader(info.context).load(root.checkout_id),
-                get_plugin_manager_promise(info.context),
-            ]
-        ).then(with_checkout)
+        return (
+            CheckoutLinesPricesByCheckoutTokenLoader(info.context)
+            .load(root.checkout_id)
+            .then(get_line_total_price)
+        )
 
     @staticmethod
     def resolve_undiscounted_total_price(root, info: ResolveInfo):
-        def with_checkout(checkout):
-            checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-            lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
-
-            def calculate_undiscounted_total_price(data):
-                (
-                    checkout_info,
-                    lines,
-                ) = data
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculate_undiscounted_base_line_total_price(
-                            line_info, checkout_info.channel
-                        )
+        def calculate_undiscounted_total_price(lines_info_map):
+            line_info = lines_info_map.get(root.pk)
+            if line_info is None:
                 return None
-
-            return Promise.all(
-                [
-                    checkout_info,
-                    lines,
-                ]
-            ).then(calculate_undiscounted_total_price)
+            return calculate_undiscounted_base_line_total_price(
+                line_info, line_info.channel
+            )
 
         return (
-            CheckoutByTokenLoader(info.context)
+            CheckoutLinesInfoMapByCheckoutTokenLoader(info.context)
             .load(root.checkout_id)
-            .then(with_checkout)
+            .then(calculate_undiscounted_total_price)
         )
 
     @staticmethod
@@ -648,7 +596,7 @@ class Checkout(ModelObjectType[models.Checkout]):
             )
             return max(taxed_total, zero_taxed_money(root.currency))
 
-        dataloaders = list(get_dataloaders_for_fetching_checkout_data(root, info))
+        dataloaders = get_dataloaders_for_fetching_checkout_data(root, info)
         return Promise.all(dataloaders).then(calculate_total_price)
 
     @staticmethod
@@ -664,7 +612,7 @@ class Checkout(ModelObjectType[models.Checkout]):
                 address=address,
             )
 
-        dataloaders = list(get_dataloaders_for_fetching_checkout_data(root, info))
+        dataloaders = get_dataloaders_for_fetching_checkout_data(root, info)
         return Promise.all(dataloaders).then(calculate_subtotal_price)
 
     @staticmethod
@@ -680,7 +628,7 @@ class Checkout(ModelObjectType[models.Checkout]):
                 address=address,
             )
 
-        dataloaders = list(get_dataloaders_for_fetching_checkout_data(root, info))
+        dataloaders = get_dataloaders_for_fetching_checkout_data(root, info)
         return Promise.all(dataloaders).then(calculate_shipping_price)
 
     @staticmethod
@@ -720,16 +668,16 @@ class Checkout(ModelObjectType[models.Checkout]):
         )
 
     @staticmethod
-    def resolve_gift_cards(root: models.Checkout, _info):
-        return root.gift_cards.all()
+    def resolve_gift_cards(root: models.Checkout, info: ResolveInfo):
+        return GiftCardsByCheckoutIdLoader(info.context).load(root.pk)
 
     @staticmethod
     def resolve_is_shipping_required(root: models.Checkout, info: ResolveInfo):
         def is_shipping_required(lines):
-            product_ids = [line_info.product.id for line_info in lines]
+            product_ids = {line_info.product.id for line_info in lines}
 
             def with_product_types(product_types):
-                return any([pt.is_shipping_required for pt in product_types])
+                return any(pt.is_shipping_required for pt in product_types)
 
             return (
                 ProductTypeByProductIdLoader(info.context)
@@ -824,7 +772,7 @@ class Checkout(ModelObjectType[models.Checkout]):
             .then(
                 lambda metadata_storage: metadata_storage.metadata.get(key)
                 if metadata_storage
-                else {}
+                else None
             )
         )
 
@@ -859,45 +807,34 @@ class Checkout(ModelObjectType[models.Checkout]):
     @staticmethod
     def resolve_private_metafield(root: models.Checkout, info, *, key: str):
         def resolve_private_metafield_with_privilege_check(metadata_storage):
+            if not metadata_storage:
+                return None
             MetaResolvers.check_private_metadata_privilege(metadata_storage, info)
             return metadata_storage.private_metadata.get(key)
 
         return (
             CheckoutMetadataByCheckoutIdLoader(info.context)
             .load(root.pk)
-            .then(
-                lambda metadata_storage: resolve_private_metafield_with_privilege_check(
-                    metadata_storage
-                )
-                if metadata_storage
-                else {}
-            )
+            .then(resolve_private_metafield_with_privilege_check)
         )
 
     @staticmethod
     def resolve_private_metafields(root: models.Checkout, info, *, keys=None):
         def resolve_private_metafields_with_privilege(metadata_storage):
+            if not metadata_storage:
+                return {}
             MetaResolvers.check_private_metadata_privilege(metadata_storage, info)
             return _filter_metadata(metadata_storage.private_metadata, keys)
 
         return (
             CheckoutMetadataByCheckoutIdLoader(info.context)
             .load(root.pk)
-            .then(
-                lambda metadata_storage: resolve_private_metafields_with_privilege(
-                    metadata_storage
-                )
-                if metadata_storage
-                else {}
-            )
+            .then(resolve_private_metafields_with_privilege)
         )
 
     @classmethod
     def resolve_type(cls, root: models.Checkout, _info):
-        item_type, _ = MetaResolvers.resolve_object_with_metadata_type(
-            root.metadata_storage
-        )
-        return item_type
+        return cls
 
     @classmethod
     def resolve_updated_at(cls, root: models.Checkout, _info):
@@ -905,41 +842,21 @@ class Checkout(ModelObjectType[models.Checkout]):
 
     @classmethod
     def resolve_authorize_status(cls, root: models.Checkout, info):
-        def _resolve_authorize_status(data):
-            address, lines, checkout_info, manager, transactions = data
-            fetch_checkout_data(
-                checkout_info=checkout_info,
-                manager=manager,
-                lines=lines,
-                address=address,
-                checkout_transactions=transactions,
-            )
+        def _resolve_authorize_status(checkout_info):
             return checkout_info.checkout.authorize_status
 
-        dataloaders = list(get_dataloaders_for_fetching_checkout_data(root, info))
-        dataloaders.append(
-            TransactionItemsByCheckoutIDLoader(info.context).load(root.pk)
+        return get_checkout_info_with_fetched_data(root, info).then(
+            _resolve_authorize_status
         )
-        return Promise.all(dataloaders).then(_resolve_authorize_status)
 
     @classmethod
     def resolve_charge_status(cls, root: models.Checkout, info):
-        def _resolve_charge_status(data):
-            address, lines, checkout_info, manager, transactions = data
-            fetch_checkout_data(
-                checkout_info=checkout_info,
-                manager=manager,
-                lines=lines,
-                address=address,
-                checkout_transactions=transactions,
-            )
+        def _resolve_charge_status(checkout_info):
             return checkout_info.checkout.charge_status
 
-        dataloaders = list(get_dataloaders_for_fetching_checkout_data(root, info))
-        dataloaders.append(
-            TransactionItemsByCheckoutIDLoader(info.context).load(root.pk)
+        return get_checkout_info_with_fetched_data(root, info).then(
+            _resolve_charge_status
         )
-        return Promise.all(dataloaders).then(_resolve_charge_status)
 
     @classmethod
     def resolve_total_balance(cls, root: models.Checkout, info):
@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from django.db.models import F
+
 from ...giftcard.models import GiftCard, GiftCardEvent, GiftCardTag
 from ...order.models import Order
 from ..core.dataloaders import DataLoader
@@ -73,3 +75,18 @@ class GiftCardsByOrderIdLoader(DataLoader):
                 gift_cards[getattr(gift_card_order, "giftcard_id")]
             )
         return [cards_map.get(order_id, []) for order_id in keys]
+
+
+class GiftCardsByCheckoutIdLoader(DataLoader):
+    context_key = "gift_cards_by_checkout_id"
+
+    def batch_load(self, keys):
+        gift_cards = (
+            GiftCard.objects.using(self.database_connection_name)
+            .filter(checkouts__in=keys)
+            .annotate(checkout_id=F("checkouts"))
+        )
+        cards_map = defaultdict(list)
+        for gift_card in gift_cards:
+            cards_map[gift_card.checkout_id].append(gift_card)
+        return [cards_map.get(checkout_id, []) for checkout_id in keys]
@@ -219,3 +219,34 @@ def test_query_private_meta_for_checkout_as_app(
     metadata = content["data"]["checkout"]["privateMetadata"][0]
     assert metadata["key"] == PRIVATE_KEY
     assert metadata["value"] == PRIVATE_VALUE
+
+
+QUERY_CHECKOUT_METAFIELDS = """
+    query checkoutMeta($token: UUID!, $key: String!){
+        checkout(token: $token){
+            metafield(key: $key)
+            privateMetafield(key: $key)
+        }
+    }
+"""
+
+
+def test_query_metafields_for_checkout_without_metadata_storage(
+    staff_api_client, checkout, permission_manage_checkouts
+):
+    # given
+    checkout.metadata_storage.delete()
+    variables = {"token": checkout.pk, "key": PUBLIC_KEY}
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_CHECKOUT_METAFIELDS,
+        variables,
+        [permission_manage_checkouts],
+        check_no_permissions=False,
+    )
+    content = get_graphql_content(response)
+
+    # then
+    assert content["data"]["checkout"]["metafield"] is None
+    assert content["data"]["checkout"]["privateMetafield"] is None
@@ -1,10 +1,21 @@
 import json
 
 from django.core.serializers.json import DjangoJSONEncoder
+from django.test.client import RequestFactory
+
+from ...tests.utils import flush_post_commit_hooks
 
 
 def get_graphql_content_from_response(response):
-    return json.loads(response.content.decode("utf8"))
+    """Return the decoded JSON content of the response.
+
+    The decoded content is cached on the response, as it's often read more than
+    once, e.g. by permission assertions and then by the test itself. The same dict
+    is returned on every call, so callers must not mutate it.
+    """
+    if not hasattr(response, "_cached_graphql_content"):
+        response._cached_graphql_content = json.loads(response.content.decode("utf8"))
+    return response._cached_graphql_content
 
 
 def get_graphql_content(response, *, ignore_errors: bool = False):
@@ -18,6 +29,34 @@ def get_graphql_content(response, *, ignore_errors: bool = False):
     return content
 
 
+def execute_graphql(query, variables=None, *, user=None, app=None):
+    """Execute a GraphQL operation in-process, without going through the view.
+
+    Skips the HTTP layer (Django middleware, authentication, JSON encoding) and is
+    meant for tests that only cover the resolver logic. The view's GraphQL
+    middleware and backend are used, but the query cost validation and the
+    view's error handling are not, so use the API clients to test behavior
+    through the real API path. The query can be a string or a parsed `Document`.
+    """
+    from ..api import API_PATH, schema
+    from ..context import get_context_value
+    from ..views import GraphQLView
+
+    view = GraphQLView(schema=schema)
+    request = RequestFactory().post(API_PATH)
+    request.app = app
+    request._cached_user = user
+    result = schema.execute(
+        query,
+        variable_values=variables,
+        context_value=get_context_value(request),
+        middleware=view.middleware,
+        backend=view.backend,
+    )
+    flush_post_commit_hooks()
+    return result
+
+
 def assert_no_permission(response):
     content = get_graphql_content_from_response(response)
     assert "errors" in content, content